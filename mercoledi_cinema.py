@@ -23,6 +23,7 @@ class JSONAttributes:
         self.rating = 0.0
         self.description = ''
         self.actors = []
+        self.seasons = []
         self.director = ''
         self.creators = []
 
@@ -36,30 +37,25 @@ class JSONAttributes:
         print("Director: ",self.director)
         print("Actors: ",self.actors)
 
-def write_json(json):
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "duration": self.duration,
+            "genre": self.genre,
+            "rating": self.rating,
+            "description": self.description,
+            "director": self.director,
+            "creators": self.creators,
+            "actors": self.actors,
+            "seasons": self.seasons,
+        }
+
+def write_json(obj):
 
     """ write data into file as json object """
 
-    file = open(json.title+'.json','w')
-    file.write('{\n')
-    file.write('"title":"'+json.title+'",\n')
-    file.write('"duration":"'+json.duration+'",\n')
-    file.write('"genre":[')
-    file.write(','.join('"'+x+'"' for x in json.genre))
-    file.write('],\n')
-    file.write('"rating":"'+json.rating+'",\n')
-    file.write('"description":"'+json.description+'",\n')
-    file.write('"director":"'+json.director+'",\n')
-    file.write('"creators":[')
-    file.write(','.join('"'+x+'"' for x in json.creators))
-    file.write('],\n')
-    file.write('"actors":[')
-    file.write(','.join('"'+x+'"' for x in json.actors))
-    file.write('],\n')
-    file.write('"seasons":[')
-    file.write(','.join('['+episode_list_as_string(season)+']\n' for season in json.seasons))
-    file.write(']\n}')
-    file.close()
+    with open(obj.title+'.json','w',encoding='utf-8',buffering=1<<16) as file:
+        json.dump(obj.to_dict(), file, ensure_ascii=False, indent=1)
     print('Writing done')
 
 #create json object. check class JSONAttributes(). it just contains variables to store values